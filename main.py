@@ -1,11 +1,19 @@
+import io
 import os
-import json
 import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
+import pyarrow as pa
+import pyarrow.json as paj
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -15,40 +23,238 @@ CONFIG_PATH = "config.json"
 DEFAULT_CONFIG = {
     "entity": "repositories",
     "base_api_url": "https://api.github.com/search/repositories",
-    "pages_to_ingest": 10 
+    "pages_to_ingest": 10,
+    # Espera (s) após um 403/429 quando a API não informa Retry-After nem X-RateLimit-Reset
+    "rate_limit_wait": 60
 }
 
+@lru_cache(maxsize=None)
 def load_config() -> Dict[str, Any]:
-    if os.path.exists(CONFIG_PATH):
-        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
-    else:
-        return DEFAULT_CONFIG
-
-config = load_config()
-ENTITY = config["entity"]
-BASE_API_URL = config["base_api_url"]
-PAGES_TO_INGEST = config["pages_to_ingest"]
+    try:
+        with open(CONFIG_PATH, "rb") as f:
+            return {**DEFAULT_CONFIG, **orjson.loads(f.read())}
+    except FileNotFoundError:
+        # Cópia: DEFAULT_CONFIG também alimenta os argumentos padrão de ingest_to_bronze
+        return dict(DEFAULT_CONFIG)
+
 BASE_DATA_PATH = "data"
+MAX_WORKERS = 8
+CHECKPOINT_BATCH_SIZE = 5
+
+# Silver é reescrita a cada execução; Gold é pequena, gravada uma vez e lida muitas
+SILVER_PARQUET_OPTIONS = {
+    "engine": "pyarrow",
+    "compression": "zstd",
+    "compression_level": 3,
+    "row_group_size": 128_000,
+    "use_dictionary": True,
+    "write_statistics": True,
+}
+GOLD_PARQUET_OPTIONS = {"engine": "pyarrow", "compression": "zstd", "compression_level": 9}
+# Colunas de baixa cardinalidade, gravadas com dictionary encoding
+CATEGORY_COLUMNS = ["language", "owner_type", "license_key"]
+GOLD_COLUMNS = ["id", "created_at", "stargazers_count", "language"]
+
+POOL_SIZE = 16
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 2
+
+# Sessão compartilhada: o handshake TCP/TLS com a API acontece uma única vez por conexão do pool
+SESSION = requests.Session()
+SESSION.headers.update({"Accept": "application/vnd.github.v3+json"})
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=POOL_SIZE,
+    pool_maxsize=POOL_SIZE,
+    max_retries=Retry(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=["GET"],
+    ),
+))
+
+# Apenas as colunas mantidas na Silver; o leitor do PyArrow ignora os demais campos da API.
+# Contadores cabem em int32 e timestamps do GitHub têm precisão de segundos.
+REPOSITORY_FIELDS = [
+    ("id", pa.int64()),
+    ("name", pa.string()),
+    ("full_name", pa.string()),
+    ("html_url", pa.string()),
+    ("description", pa.string()),
+    ("fork", pa.bool_()),
+    ("archived", pa.bool_()),
+    ("created_at", pa.timestamp("s", tz="UTC")),
+    ("updated_at", pa.timestamp("s", tz="UTC")),
+    ("pushed_at", pa.timestamp("s", tz="UTC")),
+    ("homepage", pa.string()),
+    ("size", pa.int32()),
+    ("stargazers_count", pa.int32()),
+    ("watchers_count", pa.int32()),
+    ("forks_count", pa.int32()),
+    ("open_issues_count", pa.int32()),
+    ("language", pa.string()),
+    ("topics", pa.list_(pa.string())),
+    ("default_branch", pa.string()),
+    ("owner", pa.struct([("id", pa.int64()), ("login", pa.string()), ("type", pa.string()), ("html_url", pa.string())])),
+    ("license", pa.struct([("key", pa.string())])),
+]
+BRONZE_PARSE_OPTIONS = paj.ParseOptions(
+    explicit_schema=pa.schema(REPOSITORY_FIELDS),
+    unexpected_field_behavior="ignore",
+)
 
 # Funções auxiliares
 
+def write_atomic(path: str, data: bytes):
+    # Grava num arquivo temporário e troca de uma vez: uma falha no meio nunca corrompe o original
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
 def load_checkpoint(entity: str) -> int:
     checkpoint_path = os.path.join(BASE_DATA_PATH, "checkpoints", f"{entity}.json")
-    if os.path.exists(checkpoint_path):
-        with open(checkpoint_path, "r", encoding="utf-8") as f:
-            return json.load(f).get("last_page", 0)
-    return 0
+    try:
+        with open(checkpoint_path, "rb") as f:
+            return orjson.loads(f.read()).get("last_page", 0)
+    except FileNotFoundError:
+        return 0
 
 def save_checkpoint(entity: str, page: int):
     os.makedirs(os.path.join(BASE_DATA_PATH, "checkpoints"), exist_ok=True)
     checkpoint_path = os.path.join(BASE_DATA_PATH, "checkpoints", f"{entity}.json")
-    with open(checkpoint_path, "w", encoding="utf-8") as f:
-        json.dump({"last_page": page}, f, indent=4)
+    write_atomic(checkpoint_path, orjson.dumps({"last_page": page}))
+
+def load_etag(entity: str, page: int) -> Optional[str]:
+    # O ETag só vale enquanto o arquivo Bronze que ele descreve existir
+    etag_path = os.path.join(BASE_DATA_PATH, "etags", f"{entity}_page_{page}.txt")
+    try:
+        with open(etag_path, "r", encoding="utf-8") as f:
+            etag, _, file_path = f.read().strip().partition("\n")
+    except FileNotFoundError:
+        return None
+    if not etag or not file_path or not os.path.exists(file_path):
+        return None
+    return etag
+
+def save_etag(entity: str, page: int, etag: str, file_path: str):
+    os.makedirs(os.path.join(BASE_DATA_PATH, "etags"), exist_ok=True)
+    etag_path = os.path.join(BASE_DATA_PATH, "etags", f"{entity}_page_{page}.txt")
+    with open(etag_path, "w", encoding="utf-8") as f:
+        f.write(f"{etag}\n{file_path}")
+
+def load_manifest(entity: str) -> Dict[str, float]:
+    manifest_path = os.path.join(BASE_DATA_PATH, "silver", entity, "_manifest.json")
+    try:
+        with open(manifest_path, "rb") as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
+        return {}
+
+def save_manifest(entity: str, manifest: Dict[str, float]):
+    manifest_path = os.path.join(BASE_DATA_PATH, "silver", entity, "_manifest.json")
+    write_atomic(manifest_path, orjson.dumps(manifest, option=orjson.OPT_SORT_KEYS))
 
 # Camada Bronze
 
-def ingest_to_bronze(entity: str, pages_limit: int):
+# Portão compartilhado pelos workers: com a cota no fim, nenhuma nova requisição sai antes do reset
+RATE_LIMIT_LOCK = threading.Lock()
+rate_limit_resume_at = 0.0
+
+def defer_requests_until(resume_at: float):
+    global rate_limit_resume_at
+    with RATE_LIMIT_LOCK:
+        rate_limit_resume_at = max(rate_limit_resume_at, resume_at)
+
+def wait_for_rate_limit():
+    with RATE_LIMIT_LOCK:
+        wait_time = rate_limit_resume_at - time.time()
+    if wait_time > 0:
+        logging.warning(f"Cota da API esgotada, aguardando {round(wait_time, 1)}s pelo reset...")
+        time.sleep(wait_time)
+
+class RateLimitError(Exception):
+    def __init__(self, wait_time: float):
+        super().__init__(f"Limite de taxa atingido, aguarde {round(wait_time, 1)}s")
+        self.wait_time = wait_time
+
+def rate_limit_wait(response: requests.Response, default: float) -> float:
+    # Retry-After (segundos) tem prioridade; senão espera até o reset da janela do GitHub
+    retry_after = response.headers.get("Retry-After")
+    reset_at = response.headers.get("X-RateLimit-Reset")
+    try:
+        if retry_after is not None:
+            return max(float(retry_after), 0)
+        if reset_at is not None:
+            return max(float(reset_at) - time.time(), 0)
+    except ValueError:
+        pass
+    return default
+
+def fetch_page(
+    entity: str, page_num: int, params: Dict[str, Any], base_api_url: str, rate_limit_fallback: float
+) -> Tuple[Optional[bytes], int, Optional[str]]:
+    # Requisição condicional: um 304 não consome a cota da API
+    headers = {}
+    etag = load_etag(entity, page_num)
+    if etag:
+        headers["If-None-Match"] = etag
+
+    wait_for_rate_limit()
+    # Falhas de conexão e erros 5xx são refeitos pelo Retry montado na sessão
+    response = SESSION.get(base_api_url, params={**params, "page": page_num}, headers=headers, timeout=15)
+    if response.status_code == 304:
+        return None, 0, etag
+
+    if response.status_code == 200:
+        # A página atual segue normalmente; só as próximas requisições esperam o reset
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is not None and remaining.isdigit() and int(remaining) == 0:
+            defer_requests_until(time.time() + rate_limit_wait(response, 0))
+
+        # Um repositório por linha (NDJSON), formato que o leitor do PyArrow consome em streaming
+        try:
+            repositories = orjson.loads(response.content).get("items", [])
+        except orjson.JSONDecodeError as e:
+            # Mesmo tratamento de falha de rede: a página é registrada como falha e refeita na próxima execução
+            raise requests.exceptions.InvalidJSONError(
+                f"Resposta da página {page_num} não é JSON válido: {e}", response=response
+            )
+        content = b"".join(orjson.dumps(repo) + b"\n" for repo in repositories)
+        return content, len(repositories), response.headers.get("ETag")
+
+    if response.status_code in [403, 429]:
+        wait_time = rate_limit_wait(response, rate_limit_fallback)
+        defer_requests_until(time.time() + wait_time)
+        raise RateLimitError(wait_time)
+
+    response.raise_for_status()
+    raise requests.exceptions.HTTPError(f"Resposta inesperada {response.status_code}", response=response)
+
+def fetch_and_write_page(
+    entity: str, page_num: int, params: Dict[str, Any], bronze_path: str, base_api_url: str, rate_limit_fallback: float
+) -> Optional[str]:
+    # Roda dentro do pool: a gravação de uma página se sobrepõe às requisições das demais
+    content, items_count, etag = fetch_page(entity, page_num, params, base_api_url, rate_limit_fallback)
+    if content is None:
+        return "não modificada desde a última ingestão"
+    if not items_count:
+        return None
+
+    file_path = os.path.join(bronze_path, f"page_{page_num}.ndjson")
+    with open(file_path, "wb") as f:
+        f.write(content)
+    # O ETag é gravado depois da página e amarrado ao arquivo: se ele sumir, a página é baixada de novo
+    if etag:
+        save_etag(entity, page_num, etag, file_path)
+    return "salva"
+
+def ingest_to_bronze(
+    entity: str,
+    pages_limit: int,
+    base_api_url: str = DEFAULT_CONFIG["base_api_url"],
+    rate_limit_fallback: float = DEFAULT_CONFIG["rate_limit_wait"],
+):
     start_time = time.time()
     logging.info(f"--- Iniciando Camada Bronze para '{entity}' ---")
     
@@ -56,7 +262,6 @@ def ingest_to_bronze(entity: str, pages_limit: int):
     bronze_path = os.path.join(BASE_DATA_PATH, "bronze", entity, f"{today:%Y/%m/%d}")
     os.makedirs(bronze_path, exist_ok=True)
 
-    headers = {"Accept": "application/vnd.github.v3+json"}
     params = {
         "q": "stars:>1000",
         "sort": "stars",
@@ -65,49 +270,94 @@ def ingest_to_bronze(entity: str, pages_limit: int):
     }
 
     last_page = load_checkpoint(entity)
+    saved_page = last_page
     logging.info(f"Retomando da página {last_page + 1}")
 
-    for page_num in range(last_page + 1, pages_limit + 1):
-        params["page"] = page_num
-        max_retries = 3
-        backoff_factor = 2
-
-        for attempt in range(max_retries):
-            try:
-                response = requests.get(BASE_API_URL, headers=headers, params=params, timeout=15)
-                if response.status_code == 200:
-                    data = response.json()
-                    repositories = data.get("items", [])
-                    if not repositories:
-                        logging.info("Nenhum dado adicional encontrado.")
-                        return
-
-                    file_path = os.path.join(bronze_path, f"page_{page_num}.json")
-                    with open(file_path, "w", encoding="utf-8") as f:
-                        json.dump(repositories, f, indent=4)
-
-                    save_checkpoint(entity, page_num)
-                    logging.info(f"Página {page_num} salva e checkpoint atualizado.")
+    pages = range(last_page + 1, pages_limit + 1)
+    completed = set()
+    rate_limited = []
+
+    def mark_completed(page_num: int, status: Optional[str]):
+        nonlocal last_page, saved_page
+        if status is None:
+            logging.info(f"Nenhum dado encontrado na página {page_num}.")
+            return
+
+        completed.add(page_num)
+        # O checkpoint só avança sobre páginas contíguas já persistidas
+        while last_page + 1 in completed:
+            last_page += 1
+        # last_page só cresce, então basta gravar o checkpoint a cada lote de páginas
+        if last_page - saved_page >= CHECKPOINT_BATCH_SIZE:
+            save_checkpoint(entity, last_page)
+            saved_page = last_page
+        logging.info(f"Página {page_num} {status} (páginas contíguas até {last_page}).")
+
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(
+                    fetch_and_write_page, entity, page_num, params, bronze_path, base_api_url, rate_limit_fallback
+                ): page_num
+                for page_num in pages
+            }
+            for future in as_completed(futures):
+                page_num = futures[future]
+                try:
+                    mark_completed(page_num, future.result())
+                except RateLimitError as e:
+                    logging.warning(f"Página {page_num}: {e}")
+                    rate_limited.append(page_num)
+                except requests.exceptions.RequestException as e:
+                    logging.error(f"Página {page_num} falhou: {e}. A próxima execução retoma a partir do checkpoint.")
+
+        # Páginas bloqueadas pelo limite de taxa são refeitas em série
+        if rate_limited:
+            logging.warning(f"{len(rate_limited)} página(s) bloqueadas pelo limite de taxa, continuando em série...")
+            # Espera só o que ainda falta no portão compartilhado, que os workers já respeitaram
+            wait_for_rate_limit()
+            for page_num in sorted(rate_limited):
+                try:
+                    status = fetch_and_write_page(
+                        entity, page_num, params, bronze_path, base_api_url, rate_limit_fallback
+                    )
+                    mark_completed(page_num, status)
+                except RateLimitError as e:
+                    logging.error(f"Página {page_num}: {e}. A próxima execução retoma a partir do checkpoint.")
                     break
-
-                elif response.status_code in [429, 500, 502, 503, 504, 403]:
-                    wait_time = backoff_factor * (2 ** attempt)
-                    logging.warning(f"Erro {response.status_code}, tentando novamente em {wait_time}s...")
-                    time.sleep(wait_time)
-                else:
-                    response.raise_for_status()
-
-            except requests.exceptions.RequestException as e:
-                logging.error(f"Tentativa {attempt + 1} falhou: {e}")
-                time.sleep(backoff_factor * (2 ** attempt))
-                if attempt == max_retries - 1:
-                    raise
+                except requests.exceptions.RequestException as e:
+                    logging.error(f"Página {page_num} falhou: {e}. A próxima execução retoma a partir do checkpoint.")
+    finally:
+        # Persiste o que ficou pendente do último lote, mesmo em caso de erro
+        if last_page > saved_page:
+            save_checkpoint(entity, last_page)
+        logging.info(f"Checkpoint na página {last_page}.")
 
     duration = round(time.time() - start_time, 2)
     logging.info(f"Camada Bronze finalizada em {duration}s")
 
 # Camada Silver
 
+def read_legacy_bronze_file(file_path: str) -> pa.Table:
+    # Páginas anteriores ao NDJSON: array JSON indentado ou a resposta bruta da API ({"items": [...]})
+    with open(file_path, "rb") as f:
+        data = orjson.loads(f.read())
+    if isinstance(data, dict):
+        data = data.get("items", [])
+    if not isinstance(data, list) or not data:
+        return pa.schema(REPOSITORY_FIELDS).empty_table()
+    content = b"".join(orjson.dumps(repo) + b"\n" for repo in data)
+    return paj.read_json(io.BytesIO(content), parse_options=BRONZE_PARSE_OPTIONS)
+
+def read_bronze_file(file_path: str) -> Optional[pa.Table]:
+    try:
+        if file_path.endswith(".json"):
+            return read_legacy_bronze_file(file_path)
+        return paj.read_json(file_path, parse_options=BRONZE_PARSE_OPTIONS)
+    except (pa.ArrowInvalid, orjson.JSONDecodeError):
+        logging.warning(f"Erro ao ler {os.path.basename(file_path)}")
+        return None
+
 def normalize_to_silver(entity: str):
     start_time = time.time()
     logging.info(f"--- Iniciando Camada Silver para '{entity}' ---")
@@ -116,32 +366,62 @@ def normalize_to_silver(entity: str):
     silver_path = os.path.join(BASE_DATA_PATH, "silver", entity)
     os.makedirs(silver_path, exist_ok=True)
 
-    records = []
+    path_out = os.path.join(silver_path, f"{entity}.parquet")
+
+    # Só uma Silver acompanhada do manifesto é reaproveitada; sem ela, ou com uma Silver de versão
+    # anterior (sem manifesto e com outro schema), tudo é reconstruído a partir da Bronze
+    manifest = load_manifest(entity) if os.path.exists(path_out) else {}
+    incremental = bool(manifest)
+
+    pending = []
     for root, _, files in os.walk(bronze_base):
         for f_name in files:
-            if f_name.endswith(".json"):
-                with open(os.path.join(root, f_name), "r", encoding="utf-8") as f:
-                    try:
-                        data = json.load(f)
-                        if isinstance(data, list):
-                            records.extend(data)
-                    except json.JSONDecodeError:
-                        logging.warning(f"Erro ao ler {f_name}")
-
-    if not records:
+            if f_name.endswith((".ndjson", ".json")):
+                file_path = os.path.join(root, f_name)
+                rel_path = os.path.relpath(file_path, bronze_base)
+                mtime = os.path.getmtime(file_path)
+                if manifest.get(rel_path) != mtime:
+                    pending.append((rel_path, file_path, mtime))
+
+    # O parser do PyArrow libera o GIL, então os arquivos são lidos em paralelo
+    tables = []
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = executor.map(read_bronze_file, [file_path for _, file_path, _ in pending])
+        for (rel_path, _, mtime), table in zip(pending, results):
+            if table is not None:
+                tables.append(table)
+                manifest[rel_path] = mtime
+
+    if not tables:
+        if incremental:
+            logging.info("Nenhum arquivo Bronze novo; Silver já está atualizada.")
+        elif os.path.exists(path_out):
+            logging.warning("Silver sem manifesto e nenhum arquivo Bronze para reconstruí-la; mantida como está.")
+        else:
+            logging.warning("Nenhum dado encontrado para normalização.")
+        return
+
+    # owner.* -> owner_* e license.key -> license_key
+    table = pa.concat_tables(tables).flatten()
+    df = table.to_pandas().rename(columns=lambda c: c.replace(".", "_"))
+    logging.info(f"{len(tables)} arquivo(s) Bronze novo(s) com {len(df)} registros")
+
+    # Apenas as páginas novas são lidas; o restante vem da Silver já gravada.
+    # Os registros novos vêm primeiro para vencerem empates de updated_at no idxmax.
+    if incremental:
+        df = pd.concat([df, pd.read_parquet(path_out, engine="pyarrow")], ignore_index=True)
+
+    if df.empty:
         logging.warning("Nenhum dado encontrado para normalização.")
         return
 
-    df = pd.DataFrame(records)
-    df["updated_at"] = pd.to_datetime(df["updated_at"])
-    df = df.sort_values("updated_at", ascending=False).drop_duplicates("id")
+    # Mantém a versão mais recente de cada id sem ordenar o DataFrame inteiro
+    df_clean = df.loc[df.groupby("id", sort=False)["updated_at"].idxmax()]
 
-    df_owner = pd.json_normalize(df["owner"]).add_prefix("owner_")
-    df["license_key"] = df["license"].apply(lambda x: x["key"] if isinstance(x, dict) else None)
-    df_clean = pd.concat([df.drop(columns=["owner", "license"]), df_owner], axis=1)
+    df_clean = df_clean.astype({col: "category" for col in CATEGORY_COLUMNS})
 
-    path_out = os.path.join(silver_path, f"{entity}.parquet")
-    df_clean.to_parquet(path_out, index=False)
+    df_clean.to_parquet(path_out, index=False, **SILVER_PARQUET_OPTIONS)
+    save_manifest(entity, manifest)
 
     duration = round(time.time() - start_time, 2)
     logging.info(f"Silver finalizada ({len(df_clean)} registros únicos) em {duration}s")
@@ -157,15 +437,19 @@ def create_gold_metrics(entity: str):
         logging.error("Arquivo Silver não encontrado.")
         return
 
-    df = pd.read_parquet(silver_file)
-    df["creation_date"] = pd.to_datetime(df["created_at"]).dt.date
+    df = pd.read_parquet(silver_file, columns=GOLD_COLUMNS, engine="pyarrow")
+    # Silver de versões anteriores guardava created_at como texto
+    if not pd.api.types.is_datetime64_any_dtype(df["created_at"]):
+        df["created_at"] = pd.to_datetime(df["created_at"], utc=True)
+    # datetime64[D] agrupa bem mais rápido que uma coluna object de datetime.date
+    df["creation_date"] = df["created_at"].values.astype("datetime64[D]")
 
     daily_metrics = (
         df.groupby("creation_date")
         .agg(new_repositories_count=("id", "count"), avg_stars=("stargazers_count", "mean"))
+        .round({"avg_stars": 2})
         .reset_index()
     )
-    daily_metrics["avg_stars"] = daily_metrics["avg_stars"].round(2)
 
     top_languages = df["language"].value_counts().nlargest(5).reset_index()
     top_languages.columns = ["language", "total_count"]
@@ -173,17 +457,30 @@ def create_gold_metrics(entity: str):
     gold_path = os.path.join(BASE_DATA_PATH, "gold")
     os.makedirs(gold_path, exist_ok=True)
 
-    daily_metrics.to_parquet(os.path.join(gold_path, "daily_metrics.parquet"), index=False)
-    top_languages.to_parquet(os.path.join(gold_path, "top_5_languages.parquet"), index=False)
+    daily_metrics.to_parquet(os.path.join(gold_path, "daily_metrics.parquet"), index=False, **GOLD_PARQUET_OPTIONS)
+    top_languages.to_parquet(os.path.join(gold_path, "top_5_languages.parquet"), index=False, **GOLD_PARQUET_OPTIONS)
 
     duration = round(time.time() - start_time, 2)
     logging.info(f"Gold finalizada em {duration}s")
     logging.info("\nTop 5 linguagens:\n" + str(top_languages))
 
 
-if __name__ == "__main__":
+def main():
+    # A configuração é lida só aqui, nunca na importação do módulo
+    config = load_config()
+    entity = config["entity"]
+
     logging.info("===== Mini Pipeline de Dados =====")
-    ingest_to_bronze(ENTITY, pages_limit=PAGES_TO_INGEST)
-    normalize_to_silver(ENTITY)
-    create_gold_metrics(ENTITY)
+    ingest_to_bronze(
+        entity,
+        pages_limit=config["pages_to_ingest"],
+        base_api_url=config["base_api_url"],
+        rate_limit_fallback=config["rate_limit_wait"],
+    )
+    normalize_to_silver(entity)
+    create_gold_metrics(entity)
     logging.info("===== Pipeline executado com sucesso! =====")
+
+
+if __name__ == "__main__":
+    main()